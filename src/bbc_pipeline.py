@@ -1,51 +1,274 @@
 import argparse
+import asyncio
+import logging
+import multiprocessing
 import re
+import sys
 import time
 import sqlite3
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urljoin, urlparse
 
+import aiohttp
+import lxml.etree
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; NakshWebDataBot/1.0; +learning-project)"
 }
 
-BBC_HOSTS = {"www.bbc.com", "bbc.com"}
-NEWS_PATH_RE = re.compile(r"^/news(/|/articles/)")
+_HOST_RE = re.compile(r"^(www\.)?bbc\.com\Z", re.I)
+#article slugs only; section indexes like /news/world have no h1/time to extract
+NEWS_PATH_RE = re.compile(r"^/news/articles/[a-z0-9]+/?$")
+STREAM_CHUNK = 16384
+Article = namedtuple("Article", "url title published_raw first_paragraph")
 REL_RE = re.compile(r"^\s*(\d+)\s+(minute|minutes|hour|hours|day|days|week|weeks)\s+ago\s*$", re.I)
+_UNIT_MAP = {
+    "minute": "minutes", "minutes": "minutes",
+    "hour": "hours", "hours": "hours",
+    "day": "days", "days": "days",
+    "week": "weeks", "weeks": "weeks",
+}
+_UTC = timezone.utc
+
+#shared parser; skipping id collection and blank text saves allocations per page
+_HTML_PARSER = lxml.html.HTMLParser(collect_ids=False, remove_blank_text=True)
+#same, but pinned to UTF-8 so a re-encoded page ignores whatever its own declaration claims
+_HTML_PARSER_UTF8 = lxml.html.HTMLParser(collect_ids=False, remove_blank_text=True, encoding="utf-8")
+
+#string-valued XPath: libxml2 finds the first match and builds the text, no element proxies.
+#Results still go through _norm, the one whitespace rule both parse paths share.
+_TITLE_XP = lxml.etree.XPath("string((//h1)[1])", smart_strings=False)
+_TIME_ATTR_XP = lxml.etree.XPath("string((//time)[1]/@datetime)", smart_strings=False)
+_TIME_TEXT_XP = lxml.etree.XPath("string((//time)[1])", smart_strings=False)
+#normalize-space only collapses ASCII whitespace, so non-ASCII spaces (&nbsp; and co.) are
+#mapped to " " first; the length it measures is then never shorter than _norm's
+_NON_ASCII_WS = "".join(c for c in map(chr, range(0x80, 0x3001)) if c.isspace())
+_FIRST_PARA_XP = lxml.etree.XPath(
+    "string((//p[string-length(normalize-space(translate(., '%s', '%s'))) > 60])[1])"
+    % (_NON_ASCII_WS, " " * len(_NON_ASCII_WS)),
+    smart_strings=False,
+)
+
+log = logging.getLogger("bbc")
+
+#one keep-alive session so every fetch against the BBC host reuses its connection
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=32, max_retries=0))
 
 
 def safe_get_html(url: str, timeout: int = 10, retries: int = 2, backoff: float = 2.0) -> str | None:
     last_err = None
     for attempt in range(retries + 1):
         try:
-            r = requests.get(url, headers=HEADERS, timeout=timeout)
+            r = _SESSION.get(url, timeout=timeout)
             r.raise_for_status()
             return r.text
         except requests.RequestException as e:
             last_err = e
             wait = backoff * (attempt + 1)
-            print(f"[WARN] GET failed ({attempt+1}/{retries+1}) {url} -> {e} | sleep {wait:.1f}s")
+            log.warning("[WARN] GET failed (%d/%d) %s -> %s | sleep %.1fs", attempt + 1, retries + 1, url, e, wait)
             time.sleep(wait)
-    print(f"[ERROR] All retries failed: {url} -> {last_err}")
+    log.error("[ERROR] All retries failed: %s -> %s", url, last_err)
+    return None
+
+
+def close_session() -> None:
+    _SESSION.close()
+
+
+def _err(e: BaseException) -> str:
+    #str() keeps ClientResponseError lines short; bare timeouts have no message, so name the type
+    return str(e) or type(e).__name__
+
+
+async def fetch(session: aiohttp.ClientSession, url: str, retries: int = 2, backoff: float = 2.0) -> str | None:
+    last_err = None
+    for attempt in range(retries + 1):
+        try:
+            async with session.get(url) as r:
+                r.raise_for_status()
+                #lenient decode, like requests' r.text; one stray byte shouldn't lose the page
+                return await r.text(errors="replace")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_err = e
+            wait = backoff * (attempt + 1)
+            log.warning("[WARN] GET failed (%d/%d) %s -> %s | sleep %.1fs", attempt + 1, retries + 1, url, _err(e), wait)
+            await asyncio.sleep(wait)
+    log.error("[ERROR] All retries failed: %s -> %s", url, _err(last_err))
+    return None
+
+
+def _article_pull_parser(charset: str | None) -> lxml.etree.HTMLPullParser:
+    parser = lxml.etree.HTMLPullParser(
+        events=("end",),
+        tag=("h1", "time", "p"),
+        encoding=charset,
+        collect_ids=False,
+        remove_blank_text=True,
+    )
+    parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+    return parser
+
+
+async def fetch_article_fields(session: aiohttp.ClientSession, url: str, retries: int = 2,
+                               backoff: float = 2.0) -> Article | None:
+    last_err = None
+    for attempt in range(retries + 1):
+        try:
+            async with session.get(url) as r:
+                r.raise_for_status()
+                parser = _article_pull_parser(r.charset)
+                found = {}
+                #parse while downloading; stop reading once every field is known
+                async for chunk in r.content.iter_chunked(STREAM_CHUNK):
+                    parser.feed(chunk)
+                    if _read_article_events(parser, found):
+                        break
+                else:
+                    parser.close()
+                    _read_article_events(parser, found)
+            return Article(
+                url,
+                found.get("title", ""),
+                found.get("published_raw", ""),
+                found.get("first_paragraph", "")
+            )
+        except (lxml.etree.LxmlError, LookupError) as e:
+            #empty body or unknown charset: not worth retrying, count it as a failed article
+            log.error("[ERROR] Parse failed: %s -> %s", url, _err(e))
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_err = e
+            wait = backoff * (attempt + 1)
+            log.warning("[WARN] GET failed (%d/%d) %s -> %s | sleep %.1fs", attempt + 1, retries + 1, url, _err(e), wait)
+            await asyncio.sleep(wait)
+    log.error("[ERROR] All retries failed: %s -> %s", url, _err(last_err))
     return None
 
 
+class _Pacer:
+    #politeness: request starts are spaced `interval` apart across all tasks sharing the pacer
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next = loop.time() + self.interval
+
+
+async def fetch_and_parse(sem: asyncio.Semaphore, pacer: _Pacer, session: aiohttp.ClientSession, url: str,
+                          label: str, run_ts_utc: str, retries: int,
+                          pool: ProcessPoolExecutor | None = None) -> tuple | None:
+    html = None
+    a = None
+    async with sem:
+        await pacer.wait()
+        log.info("[INFO] (%s) %s", label, url)
+        if pool is None:
+            a = await fetch_article_fields(session, url, retries=retries)
+        else:
+            html = await fetch(session, url, retries=retries)
+
+    if html:
+        #parse off the GIL, outside the semaphore so the next fetch can start
+        a = await asyncio.get_running_loop().run_in_executor(pool, extract_article_fields, html, url)
+
+    if a is None:
+        return None
+
+    log.info("[OK] %s", a.title[:80])
+    #final bbc_articles row, in upsert column order
+    return (a.url, run_ts_utc, a.title, a.published_raw, parse_published_to_iso(a.published_raw, run_ts_utc),
+            a.first_paragraph)
+
+
+def _parse_pool(workers: int) -> ProcessPoolExecutor:
+    #workers start after aiohttp's resolver threads exist; forking then can copy a held lock,
+    #so start them from a clean forkserver (spawn where that isn't available)
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+async def run_enrich(urls: list[str], run_ts_utc: str, concurrency: int = 6, sleep: float = 1.0,
+                     timeout: int = 10, retries: int = 2, parse_workers: int = 0) -> list[tuple | None]:
+    concurrency = max(1, concurrency)
+    sem = asyncio.Semaphore(concurrency)
+    #--sleep was the gap between serial fetches; concurrency buys proportionally more requests per second
+    pacer = _Pacer(sleep / concurrency)
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    #0 workers: stream-parse inline; otherwise download whole pages and parse in a process pool
+    pool = _parse_pool(parse_workers) if parse_workers > 0 else None
+
+    try:
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=client_timeout) as session:
+            tasks = [
+                fetch_and_parse(sem, pacer, session, url, f"{i}/{len(urls)}", run_ts_utc, retries, pool)
+                for i, url in enumerate(urls, start=1)
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    #one bad article counts as a failure instead of dropping the whole batch
+    out = []
+    for url, res in zip(urls, results):
+        if isinstance(res, BaseException):
+            log.error("[ERROR] Enrich failed: %s -> %s", url, _err(res))
+            res = None
+        out.append(res)
+    return out
+
+
+def _parse_html(html: str):
+    #BeautifulSoup never raised on odd pages; keep that: bodies lxml finds empty
+    #(comment- or script-only) give None instead of an exception
+    if not html.strip():
+        return None
+    try:
+        try:
+            return lxml.html.fromstring(html, parser=_HTML_PARSER)
+        except ValueError:
+            #lxml refuses str input with an <?xml encoding=...?> declaration; the text is
+            #already decoded, so hand it over as UTF-8 bytes instead
+            return lxml.html.fromstring(html.encode("utf-8"), parser=_HTML_PARSER_UTF8)
+    except lxml.etree.LxmlError:
+        return None
+
+
 def extract_homepage_article_urls(html: str, base: str) -> list[str]:
-    soup = BeautifulSoup(html, "lxml")
+    doc = _parse_html(html)
+    if doc is None:
+        return []
+
     found = []
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        if not href:
+    for href in doc.xpath("//a/@href"):
+        href = href.strip()
+        #cheap rejects before paying for urljoin/urlparse
+        if not href or href[0] in "#?" or href.startswith(("mailto:", "javascript:", "tel:")):
+            continue
+        if href.startswith("http") and "bbc.com" not in href[:30].lower():
             continue
 
         full = urljoin(base, href)
         parsed = urlparse(full)
 
-        if parsed.netloc.lower() not in BBC_HOSTS:
+        if not _HOST_RE.match(parsed.netloc):
             continue
         if not NEWS_PATH_RE.match(parsed.path):
             continue
@@ -53,40 +276,67 @@ def extract_homepage_article_urls(html: str, base: str) -> list[str]:
         normalized = parsed._replace(fragment="").geturl()
         found.append(normalized)
 
-    #preserve order
-    seen = set()
-    out = []
-    for u in found:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
-    return out
+    #dedup, preserve order
+    return list(dict.fromkeys(found))
 
 
-def extract_article_fields(html: str, url: str) -> dict:
-    soup = BeautifulSoup(html, "lxml")
+def _norm(s: str) -> str:
+    return " ".join(s.split())
 
-    h1 = soup.find("h1")
-    title = h1.get_text(" ", strip=True) if h1 else ""
 
-    t = soup.find("time")
-    published_raw = ""
-    if t:
-        published_raw = (t.get("datetime") or t.get_text(" ", strip=True) or "").strip()
+def _text(el) -> str:
+    return _norm(el.text_content())
+
+
+def _first_long_paragraph(doc) -> str:
+    #the XPath candidate is right whenever it survives _norm; only control-character
+    #whitespace (which XPath can't name) can shrink it, and then a full scan decides
+    txt = _norm(_FIRST_PARA_XP(doc))
+    if not txt or len(txt) > 60:
+        return txt
+    for p in doc.iter("p"):
+        txt = _text(p)
+        if len(txt) > 60:
+            return txt
+    return ""
 
+
+def extract_article_fields(html: str, url: str) -> Article:
+    title = ""
+    published_raw = ""
     first_para = ""
-    for p in soup.find_all("p"):
-        txt = p.get_text(" ", strip=True)
-        if txt and len(txt) > 60:
-            first_para = txt
-            break
 
-    return {
-        "url": url,
-        "title": title,
-        "published_raw": published_raw,
-        "first_paragraph": first_para
-    }
+    doc = _parse_html(html)
+    if doc is not None:
+        title = _norm(_TITLE_XP(doc))
+        published_raw = _norm(_TIME_ATTR_XP(doc)) or _norm(_TIME_TEXT_XP(doc))
+        first_para = _first_long_paragraph(doc)
+
+    return Article(url, title, published_raw, first_para)
+
+
+def _read_article_events(parser: lxml.etree.HTMLPullParser, found: dict) -> bool:
+    #same first-match and _norm rules as extract_article_fields, applied as elements close
+    for _, el in parser.read_events():
+        if el.tag == "h1":
+            found.setdefault("title", _text(el))
+        elif el.tag == "time":
+            found.setdefault("published_raw", _norm(el.get("datetime") or "") or _text(el))
+        elif "first_paragraph" not in found:
+            txt = _text(el)
+            if len(txt) > 60:
+                found["first_paragraph"] = txt
+    return len(found) == 3
+
+
+def _is_plain_utc_stamp(p: str) -> bool:
+    #only stamps valid on any date qualify (day <= 28); the rest go through fromisoformat
+    return (len(p) == 20 and p[19] == "Z" and p.isascii()
+            and p[4] == "-" and p[7] == "-" and p[10] == "T" and p[13] == ":" and p[16] == ":"
+            and p[:4].isdigit() and p[5:7].isdigit() and p[8:10].isdigit()
+            and p[11:13].isdigit() and p[14:16].isdigit() and p[17:19].isdigit()
+            and p[:4] != "0000" and "01" <= p[5:7] <= "12" and "01" <= p[8:10] <= "28"
+            and p[11:13] <= "23" and p[14:16] <= "59" and p[17:19] <= "59")
 
 
 def parse_published_to_iso(published_raw: str, run_ts_utc: str) -> str:
@@ -95,51 +345,79 @@ def parse_published_to_iso(published_raw: str, run_ts_utc: str) -> str:
 
     p = published_raw.strip()
 
+    #fast path for BBC's usual <time datetime="YYYY-MM-DDTHH:MM:SSZ">
+    if _is_plain_utc_stamp(p):
+        return p[:-1] + "+00:00"
+
   
     try:
         if p.endswith("Z"):
             dt = datetime.fromisoformat(p.replace("Z", "+00:00"))
-            return dt.astimezone(timezone.utc).isoformat()
+            return dt.astimezone(_UTC).isoformat()
        
         if "T" in p and ("+" in p or p.endswith("00:00")):
             dt = datetime.fromisoformat(p)
-            return dt.astimezone(timezone.utc).isoformat()
+            return dt.astimezone(_UTC).isoformat()
     except Exception:
         pass
 
    
     m = REL_RE.match(p)
     if m:
-        n = int(m.group(1))
-        unit = m.group(2).lower()
+        key = _UNIT_MAP.get(m.group(2).lower())
+        if not key:
+            return ""
 
         try:
             base = datetime.fromisoformat(run_ts_utc.replace("Z", "+00:00"))
-            if base.tzinfo is None:
-                base = base.replace(tzinfo=timezone.utc)
-            base = base.astimezone(timezone.utc)
         except Exception:
-            base = datetime.now(timezone.utc)
-
-        if "minute" in unit:
-            dt = base - timedelta(minutes=n)
-        elif "hour" in unit:
-            dt = base - timedelta(hours=n)
-        elif "day" in unit:
-            dt = base - timedelta(days=n)
-        elif "week" in unit:
-            dt = base - timedelta(weeks=n)
-        else:
-            return ""
+            base = datetime.now(_UTC)
+        if base.tzinfo is None:
+            base = base.replace(tzinfo=_UTC)
 
+        dt = base.astimezone(_UTC) - timedelta(**{key: int(m.group(1))})
         return dt.isoformat()
 
     return ""
 
 
-def init_db(db_file: str) -> None:
-    conn = sqlite3.connect(db_file)
+#module-level SQL; sqlite3's statement cache is keyed by SQL text, so repeat calls reuse the prepared statement
+_UPSERT_SQL = """
+    INSERT INTO bbc_articles
+    (url, run_ts_utc, title, published_raw, published_iso, first_paragraph)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        run_ts_utc = excluded.run_ts_utc,
+        title = excluded.title,
+        published_raw = excluded.published_raw,
+        published_iso = excluded.published_iso,
+        first_paragraph = excluded.first_paragraph
+    WHERE bbc_articles.title IS NOT excluded.title
+       OR bbc_articles.published_iso IS NOT excluded.published_iso
+       OR bbc_articles.first_paragraph IS NOT excluded.first_paragraph
+"""
+_NEWEST_SQL = """
+    SELECT published_iso, title, url
+    FROM bbc_articles
+    WHERE published_iso > ''
+    ORDER BY published_iso DESC
+    LIMIT ?
+"""
+
+
+def _connect(db_file: str) -> sqlite3.Connection:
+    #autocommit; writers manage BEGIN/COMMIT themselves
+    conn = sqlite3.connect(db_file, isolation_level=None)
+    #per-connection settings; journal_mode is persisted by init_db
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    return conn
+
+
+def init_db(conn: sqlite3.Connection) -> None:
     cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
     cur.execute("""
     CREATE TABLE IF NOT EXISTS bbc_articles (
         url TEXT PRIMARY KEY,
@@ -150,58 +428,56 @@ def init_db(db_file: str) -> None:
         first_paragraph TEXT
     )
     """)
-    conn.commit()
-    conn.close()
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_articles_pub_iso ON bbc_articles(published_iso)")
+
 
+def get_new_urls(conn: sqlite3.Connection, urls: list[str]) -> list[str]:
+    if not urls:
+        return []
 
-def get_existing_urls(db_file: str) -> set[str]:
-    conn = sqlite3.connect(db_file)
     cur = conn.cursor()
-    cur.execute("SELECT url FROM bbc_articles")
-    rows = cur.fetchall()
-    conn.close()
-    return {r[0] for r in rows}
+    conn.execute("BEGIN")
+    try:
+        cur.execute("CREATE TEMP TABLE candidates(url TEXT PRIMARY KEY)")
+        cur.executemany("INSERT OR IGNORE INTO candidates VALUES (?)", [(u,) for u in urls])
+        #anti-join in SQL; rowid keeps homepage order
+        rows = cur.execute("""
+            SELECT c.url
+            FROM candidates c
+            LEFT JOIN bbc_articles a ON a.url = c.url
+            WHERE a.url IS NULL
+            ORDER BY c.rowid
+        """).fetchall()
+        cur.execute("DROP TABLE candidates")
+        conn.execute("COMMIT")
+    except Exception:
+        #also undoes the temp table create
+        conn.execute("ROLLBACK")
+        raise
+    return [r[0] for r in rows]
 
 
-def upsert_rows(db_file: str, rows: list[dict]) -> int:
+def upsert_rows(conn: sqlite3.Connection, rows: list[tuple]) -> int:
+    #rows are (url, run_ts_utc, title, published_raw, published_iso, first_paragraph)
     if not rows:
         return 0
 
-    conn = sqlite3.connect(db_file)
     cur = conn.cursor()
-    n = 0
-
-    for row in rows:
-        cur.execute("""
-        INSERT OR REPLACE INTO bbc_articles
-        (url, run_ts_utc, title, published_raw, published_iso, first_paragraph)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            row.get("url", ""),
-            row.get("run_ts_utc", ""),
-            row.get("title", ""),
-            row.get("published_raw", ""),
-            row.get("published_iso", ""),
-            row.get("first_paragraph", "")
-        ))
-        n += 1
 
-    conn.commit()
-    conn.close()
-    return n
+    conn.execute("BEGIN")
+    try:
+        #skip the write entirely when an existing row has the same content
+        cur.executemany(_UPSERT_SQL, rows)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return cur.rowcount
 
 
-def print_newest(db_file: str, n: int = 10) -> None:
-    conn = sqlite3.connect(db_file)
+def print_newest(conn: sqlite3.Connection, n: int = 10) -> None:
     cur = conn.cursor()
-    rows = list(cur.execute("""
-        SELECT published_iso, title, url
-        FROM bbc_articles
-        WHERE published_iso != ''
-        ORDER BY published_iso DESC
-        LIMIT ?
-    """, (n,)))
-    conn.close()
+    rows = list(cur.execute(_NEWEST_SQL, (n,)))
 
     print(f"\nNewest {n} by published_iso:")
     for pub, title, url in rows:
@@ -216,61 +492,62 @@ def main():
     parser.add_argument("--db", default="bbc_articles.db")
     parser.add_argument("--limit-links", type=int, default=60)
     parser.add_argument("--sleep", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=6)
+    parser.add_argument("--parse-workers", type=int, default=0)
     parser.add_argument("--timeout", type=int, default=10)
     parser.add_argument("--retries", type=int, default=2)
     parser.add_argument("--newest", type=int, default=10)
     args = parser.parse_args()
 
-    init_db(args.db)
-
-    run_ts_utc = datetime.now(timezone.utc).isoformat()
-    homepage_url = urljoin(args.base, args.path)
-
-    print("[INFO] Fetching homepage:", homepage_url)
-    home_html = safe_get_html(homepage_url, timeout=args.timeout, retries=args.retries)
-    if not home_html:
-        print("[ERROR] Could not fetch homepage.")
-        return
-
-    links = extract_homepage_article_urls(home_html, args.base)[: args.limit_links]
-    print("[INFO] Links found:", len(links))
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
-    existing = get_existing_urls(args.db)
-    to_fetch = [u for u in links if u not in existing]
-    print("[INFO] New links to enrich:", len(to_fetch))
-
-    rows_out = []
-    ok = 0
-    fail = 0
-
-    for i, url in enumerate(to_fetch, start=1):
-        print(f"[INFO] ({i}/{len(to_fetch)}) {url}")
-        html = safe_get_html(url, timeout=args.timeout, retries=args.retries)
-        if not html:
-            fail += 1
-            continue
-
-        data = extract_article_fields(html, url)
-        data["run_ts_utc"] = run_ts_utc
-        data["published_iso"] = parse_published_to_iso(data.get("published_raw", ""), run_ts_utc)
-
-        rows_out.append(data)
-        ok += 1
-        print(f"[OK] {data.get('title','')[:80]}")
-        time.sleep(args.sleep)
-
-    inserted = upsert_rows(args.db, rows_out)
-
-    print("\n[SUMMARY]")
-    print("Run timestamp (UTC):", run_ts_utc)
-    print("Homepage links scanned:", len(links))
-    print("New attempted:", len(to_fetch))
-    print("Enriched OK:", ok)
-    print("Failed:", fail)
-    print("Upserted rows:", inserted)
-    print("DB:", args.db)
-
-    print_newest(args.db, n=args.newest)
+    conn = _connect(args.db)
+    try:
+        init_db(conn)
+
+        run_ts_utc = sys.intern(datetime.now(timezone.utc).isoformat())
+        homepage_url = urljoin(args.base, args.path)
+
+        log.info("[INFO] Fetching homepage: %s", homepage_url)
+        home_html = safe_get_html(homepage_url, timeout=args.timeout, retries=args.retries)
+        if not home_html:
+            log.error("[ERROR] Could not fetch homepage.")
+            return
+
+        links = extract_homepage_article_urls(home_html, args.base)[: args.limit_links]
+        log.info("[INFO] Links found: %d", len(links))
+
+        to_fetch = get_new_urls(conn, links)
+        log.info("[INFO] New links to enrich: %d", len(to_fetch))
+
+        results = asyncio.run(run_enrich(
+            to_fetch,
+            run_ts_utc,
+            concurrency=args.concurrency,
+            sleep=args.sleep,
+            timeout=args.timeout,
+            retries=args.retries,
+            parse_workers=args.parse_workers,
+        ))
+        rows_out = [r for r in results if r]
+        ok = len(rows_out)
+        fail = len(to_fetch) - ok
+
+        inserted = upsert_rows(conn, rows_out)
+
+        print("\n[SUMMARY]")
+        print("Run timestamp (UTC):", run_ts_utc)
+        print("Homepage links scanned:", len(links))
+        print("New attempted:", len(to_fetch))
+        print("Enriched OK:", ok)
+        print("Failed:", fail)
+        print("Upserted rows:", inserted)
+        print("DB:", args.db)
+
+        print_newest(conn, n=args.newest)
+    finally:
+        close_session()
+        conn.close()
 
 
 if __name__ == "__main__":
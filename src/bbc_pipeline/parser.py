@@ -1,7 +1,10 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
+# only the tags extract_article_fields and its helpers look at
+_ARTICLE_STRAINER = SoupStrainer(["h1", "time", "p", "meta", "span"])
+
 
 def parse_published_to_iso(published_raw: str, run_ts_utc: str) -> str:
     """
@@ -67,7 +70,7 @@ def extract_description(soup: BeautifulSoup) -> str:
 
 
 def extract_article_fields(html: str, url: str) -> dict:
-    soup = BeautifulSoup(html, "lxml")
+    soup = BeautifulSoup(html, "lxml", parse_only=_ARTICLE_STRAINER)
 
     # title
     h1 = soup.find("h1")
@@ -1,7 +1,9 @@
 import re
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+_A_STRAINER = SoupStrainer("a", href=True)
 
 
 def is_valid_bbc_news_path(path: str) -> bool:
@@ -9,7 +11,7 @@ def is_valid_bbc_news_path(path: str) -> bool:
 
 
 def extract_bbc_links(home_html: str, base_url: str, limit: int = 60) -> list[str]:
-    soup = BeautifulSoup(home_html, "lxml")
+    soup = BeautifulSoup(home_html, "lxml", parse_only=_A_STRAINER)
 
     seen: set[str] = set()
     out: list[str] = []
@@ -0,0 +1,7 @@
+# src/bbc_pipeline.py is shadowed by the bbc_pipeline package on the import path.
+# Executing it into this module gives tests (and process-pool workers, which re-import
+# by module name) a normal importable name for the standalone script.
+from pathlib import Path
+
+_PATH = Path(__file__).resolve().parents[1] / "src" / "bbc_pipeline.py"
+exec(compile(_PATH.read_text(encoding="utf-8"), str(_PATH), "exec"))
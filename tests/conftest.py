@@ -0,0 +1,11 @@
+import pytest
+
+import bbc_pipeline_script as script
+
+
+@pytest.fixture
+def conn():
+    c = script._connect(":memory:")
+    script.init_db(c)
+    yield c
+    c.close()
@@ -0,0 +1,43 @@
+import sqlite3
+
+import pytest
+
+import bbc_pipeline_script as script
+
+
+def test_get_new_urls_skips_stored_keeps_order_and_dedups(conn):
+    script.upsert_rows(conn, [("https://www.bbc.com/news/articles/b", "ts", "B", "", "", "")])
+
+    urls = [
+        "https://www.bbc.com/news/articles/c",
+        "https://www.bbc.com/news/articles/b",
+        "https://www.bbc.com/news/articles/a",
+        "https://www.bbc.com/news/articles/c",
+    ]
+    assert script.get_new_urls(conn, urls) == [
+        "https://www.bbc.com/news/articles/c",
+        "https://www.bbc.com/news/articles/a",
+    ]
+    #temp table is cleaned up, so a second call works on the same connection
+    assert script.get_new_urls(conn, urls[:1]) == ["https://www.bbc.com/news/articles/c"]
+
+def test_upsert_rows_only_writes_changed_rows(conn):
+    row = ("https://www.bbc.com/news/articles/a", "run1", "Title", "raw", "2026-02-25T04:32:30+00:00", "Para")
+
+    assert script.upsert_rows(conn, [row]) == 1
+    #identical content from a later run is left untouched
+    assert script.upsert_rows(conn, [row[:1] + ("run2",) + row[2:]]) == 0
+    assert conn.execute("SELECT run_ts_utc FROM bbc_articles").fetchone() == ("run1",)
+
+    changed = row[:1] + ("run3", "New title") + row[3:]
+    assert script.upsert_rows(conn, [changed]) == 1
+    assert conn.execute("SELECT run_ts_utc, title FROM bbc_articles").fetchall() == [("run3", "New title")]
+
+def test_failed_upsert_rolls_back_and_leaves_connection_usable(conn):
+    good = ("https://www.bbc.com/news/articles/a", "run1", "A", "", "", "")
+
+    with pytest.raises(sqlite3.Error):
+        script.upsert_rows(conn, [good, ("too", "short")])
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) FROM bbc_articles").fetchone() == (0,)
+    assert script.get_new_urls(conn, [good[0]]) == [good[0]]
@@ -0,0 +1,43 @@
+import bbc_pipeline_script as script
+
+
+def test_news_path_re_matches_article_slugs_only():
+    assert script.NEWS_PATH_RE.match("/news/articles/c0jq8jzq2nno")
+    assert script.NEWS_PATH_RE.match("/news/articles/c0jq8jzq2nno/")
+    assert not script.NEWS_PATH_RE.match("/news/world")
+    assert not script.NEWS_PATH_RE.match("/news/technology")
+    assert not script.NEWS_PATH_RE.match("/news/articles/")
+
+def test_extract_homepage_article_urls_filters_and_dedups():
+    html = """
+    <html>
+      <body>
+        <a href="/news/articles/c0jq8jzq2nno#comments">Story</a>
+        <a href="/news/world">World</a>
+        <a href="https://www.bbc.com/news/articles/c0jq8jzq2nno">Story again</a>
+        <a href="https://example.com/news/articles/c0jq8jzq2nno">Elsewhere</a>
+        <a href="mailto:news@bbc.co.uk">Mail</a>
+      </body>
+    </html>
+    """
+    out = script.extract_homepage_article_urls(html, "https://www.bbc.com")
+    assert out == ["https://www.bbc.com/news/articles/c0jq8jzq2nno"]
+
+def test_extract_homepage_article_urls_tolerates_unparseable_pages():
+    assert script.extract_homepage_article_urls("<!-- nothing but a comment -->", "https://www.bbc.com") == []
+
+def test_extract_homepage_article_urls_handles_xml_declaration():
+    xml_decl = '<?xml version="1.0" encoding="utf-8"?><html><body><a href="/news/articles/abc">x</a></body></html>'
+    assert script.extract_homepage_article_urls(xml_decl, "https://www.bbc.com") == [
+        "https://www.bbc.com/news/articles/abc"
+    ]
+
+def test_extract_article_fields_tolerates_unparseable_pages():
+    empty = script.Article("u", "", "", "")
+    assert script.extract_article_fields("<!-- nothing but a comment -->", "u") == empty
+
+def test_extract_article_fields_handles_xml_declaration():
+    assert script.extract_article_fields('<?xml version="1.0" encoding="utf-8"?><h1>x</h1>', "u").title == "x"
+    #the str is already decoded, so a stale declared charset must not re-decode it
+    latin = '<?xml version="1.0" encoding="iso-8859-1"?><html><body><h1>Caf\u00e9</h1></body></html>'
+    assert script.extract_article_fields(latin, "u").title == "Caf\u00e9"
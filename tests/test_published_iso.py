@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import bbc_pipeline_script as script
+
+RUN_TS = "2026-02-25T05:00:00+00:00"
+
+def test_parse_published_fast_path():
+    assert script.parse_published_to_iso(" 2026-02-25T04:32:30Z ", RUN_TS) == "2026-02-25T04:32:30+00:00"
+
+@pytest.mark.parametrize("raw, expected", [
+    ("2026-02-25T04:32:30+01:00", "2026-02-25T03:32:30+00:00"),
+    ("2026-02-25T04:32:30.5Z", "2026-02-25T04:32:30.500000+00:00"),
+    #day > 28 and leap days skip the fast path but are still valid
+    ("2024-02-29T23:59:59Z", "2024-02-29T23:59:59+00:00"),
+])
+def test_parse_published_iso_outside_fast_path(raw, expected):
+    assert script.parse_published_to_iso(raw, RUN_TS) == expected
+
+@pytest.mark.parametrize("raw", [
+    "2026-13-45T99:99:99Z",
+    "abcd-ef-ghTij:kl:mnZ",
+    "2026-02-30T04:32:30Z",
+    "２０２６-02-25T04:32:30Z",
+    "",
+])
+def test_parse_published_malformed_gives_empty(raw):
+    assert script.parse_published_to_iso(raw, RUN_TS) == ""
+
+@pytest.mark.parametrize("raw, delta", [
+    ("3 hours ago", timedelta(hours=3)),
+    ("1 Minute ago", timedelta(minutes=1)),
+    ("2 weeks ago", timedelta(weeks=2)),
+])
+@pytest.mark.parametrize("run_ts", ["2026-02-25T07:00:00+02:00", "2026-02-25T05:00:00Z", "2026-02-25T05:00:00"])
+def test_parse_published_relative_from_run_ts(raw, delta, run_ts):
+    #aware stamps are converted to UTC, naive ones are taken as UTC
+    expected = (datetime(2026, 2, 25, 5, tzinfo=timezone.utc) - delta).isoformat()
+    assert script.parse_published_to_iso(raw, run_ts) == expected
+
+@pytest.mark.parametrize("raw, delta", [
+    ("3 hours ago", timedelta(hours=3)),
+    ("1 Minute ago", timedelta(minutes=1)),
+    ("2 weeks ago", timedelta(weeks=2)),
+])
+def test_parse_published_relative_with_invalid_run_ts_uses_now(raw, delta):
+    before = datetime.now(timezone.utc)
+    got = datetime.fromisoformat(script.parse_published_to_iso(raw, "not a timestamp"))
+    after = datetime.now(timezone.utc)
+    assert got.utcoffset() == timedelta(0)
+    assert before - delta <= got <= after - delta
@@ -0,0 +1,113 @@
+import asyncio
+
+import bbc_pipeline_script as script
+
+
+def _feed(chunks, charset="utf-8"):
+    parser = script._article_pull_parser(charset)
+    found = {}
+    for i, chunk in enumerate(chunks, start=1):
+        parser.feed(chunk)
+        if script._read_article_events(parser, found):
+            return found, i
+    parser.close()
+    script._read_article_events(parser, found)
+    return found, len(chunks)
+
+def test_read_article_events_stops_once_all_fields_found():
+    long_para = "This is a long paragraph that is definitely longer than sixty characters in total."
+    chunks = [
+        b"<html><body><h1>Test <b>Title</b></h1>",
+        b'<time datetime="2026-02-25T04:32:30Z"></time><p>short</p>',
+        f"<p>{long_para}</p>".encode(),
+        b"<p>never reached</p></body></html>",
+    ]
+    found, used = _feed(chunks)
+    assert used == 3
+    assert found == {"title": "Test Title", "published_raw": "2026-02-25T04:32:30Z", "first_paragraph": long_para}
+
+def test_read_article_events_without_time_reads_to_end():
+    long_para = "Another paragraph that comfortably clears the sixty character threshold for sure."
+    found, used = _feed([b"<html><body><h1>No time</h1>", f"<p>{long_para}</p></body></html>".encode()])
+    assert used == 2
+    assert found == {"title": "No time", "first_paragraph": long_para}
+
+def test_stream_and_full_parse_normalise_whitespace_alike():
+    #padding only looks long to ASCII-only normalize-space; \x0c is whitespace XPath can't name
+    long_para = "A real first paragraph that comfortably clears the sixty character threshold."
+    html = (
+        "<html><body><h1>A&nbsp;B</h1><time datetime='&#8195;2026-02-25T04:32:30Z '></time>"
+        "<p>short" + "&nbsp;" * 30 + "text</p><p>tiny" + "\x0c" * 70 + "</p>"
+        "<p>" + long_para.replace(" ", "&#8202; ") + "</p></body></html>"
+    )
+    streamed, _ = _feed([html.encode()])
+    art = script.extract_article_fields(html, "u")
+    assert art == script.Article("u", "A B", "2026-02-25T04:32:30Z", long_para)
+    assert streamed == {"title": art.title, "published_raw": art.published_raw, "first_paragraph": art.first_paragraph}
+
+class _FakeContent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def iter_chunked(self, n):
+        for chunk in self.chunks:
+            yield chunk
+
+class _FakeResponse:
+    def __init__(self, chunks, charset="utf-8"):
+        self.content = _FakeContent(chunks)
+        self.charset = charset
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class _FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url):
+        return self.response
+
+def test_fetch_article_fields_counts_unparseable_bodies_as_failures():
+    empty = _FakeSession(_FakeResponse([]))
+    assert asyncio.run(script.fetch_article_fields(empty, "u", retries=0)) is None
+
+    bad_charset = _FakeSession(_FakeResponse([b"<h1>x</h1>"], charset="nope-9"))
+    assert asyncio.run(script.fetch_article_fields(bad_charset, "u", retries=0)) is None
+
+    ok = _FakeSession(_FakeResponse([b"<html><body><h1>Fine</h1></body></html>"]))
+    assert asyncio.run(script.fetch_article_fields(ok, "u", retries=0)) == script.Article("u", "Fine", "", "")
+
+class _TimeoutSession:
+    def get(self, url):
+        raise asyncio.TimeoutError()
+
+def test_fetch_logs_message_or_type_name(caplog):
+    assert asyncio.run(script.fetch(_TimeoutSession(), "u", retries=0, backoff=0)) is None
+    assert "[ERROR] All retries failed: u -> TimeoutError" in caplog.text
+
+class _TextResponse(_FakeResponse):
+    def __init__(self, text):
+        super().__init__([])
+        self._text = text
+
+    async def text(self, errors="strict"):
+        return self._text
+
+def test_fetch_and_parse_in_process_pool():
+    html = '<?xml version="1.0" encoding="utf-8"?><html><body><h1>Pooled</h1><time>2 hours ago</time></body></html>'
+    session = _FakeSession(_TextResponse(html))
+
+    async def run():
+        with script._parse_pool(1) as pool:
+            return await script.fetch_and_parse(asyncio.Semaphore(1), script._Pacer(0), session, "u", "1/1",
+                                                "2026-02-25T05:00:00+00:00", 0, pool)
+
+    assert asyncio.run(run()) == ("u", "2026-02-25T05:00:00+00:00", "Pooled", "2 hours ago",
+                                  "2026-02-25T03:00:00+00:00", "")